@@ -1,4 +1,8 @@
-from x402.clients.base import x402Client, decode_x_payment_response
+from x402.clients.base import (
+    x402Client,
+    decode_x_payment_response,
+    decode_x_payment_response_typed,
+)
 from x402.clients.httpx import (
     x402_payment_hooks,
     x402HttpxClient,
@@ -12,6 +16,7 @@ from x402.clients.requests import (
 __all__ = [
     "x402Client",
     "decode_x_payment_response",
+    "decode_x_payment_response_typed",
     "x402_payment_hooks",
     "x402HttpxClient",
     "x402HTTPAdapter",
@@ -1,9 +1,12 @@
+import base64
 import time
 from typing import Optional, Callable, Dict, Any, List
 from eth_account import Account
+from pydantic import TypeAdapter
 from x402.exact import sign_payment_header
 from x402.types import (
     PaymentRequirements,
+    SettleResponse,
     UnsupportedSchemeException,
 )
 from x402.common import x402_VERSION
@@ -11,6 +14,8 @@ import secrets
 from x402.encoding import safe_base64_decode
 import json
 
+_SETTLE_RESPONSE_ADAPTER = TypeAdapter(SettleResponse)
+
 # Define type for the payment requirements selector
 PaymentSelectorCallable = Callable[
     [List[PaymentRequirements], Optional[str], Optional[str], Optional[int]],
@@ -36,6 +41,23 @@ def decode_x_payment_response(header: str) -> Dict[str, Any]:
     return result
 
 
+def decode_x_payment_response_typed(header: str) -> SettleResponse:
+    """Decode the X-PAYMENT-RESPONSE header straight into a SettleResponse.
+
+    Validates the JSON bytes directly in pydantic-core without building an
+    intermediate Python dict, unlike decode_x_payment_response.
+
+    Args:
+        header: The X-PAYMENT-RESPONSE header to decode
+
+    Returns:
+        The decoded payment response as a SettleResponse model
+    """
+    return _SETTLE_RESPONSE_ADAPTER.validate_json(
+        base64.b64decode(header, validate=True)
+    )
+
+
 class PaymentError(Exception):
     """Base class for payment-related errors."""
 
@@ -193,7 +215,7 @@ class x402Client:
         )
         return signed_header
 
-    def generate_nonce(self):
-        # Generate a random nonce (32 bytes = 64 hex chars)
-        nonce = secrets.token_hex(32)
-        return nonce
+    def generate_nonce(self) -> str:
+        # Generate a random nonce (32 bytes = 64 hex chars) straight from the
+        # CSPRNG in a single call
+        return secrets.token_hex(32)
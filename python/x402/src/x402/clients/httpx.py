@@ -14,11 +14,20 @@ class HttpxHooks:
     def __init__(self, client: x402Client):
         self.client = client
         self._is_retry = False
+        # Lazily-created client reused across retries so keep-alive
+        # connections amortize TCP/TLS setup
+        self._retry_client: Optional[AsyncClient] = None
 
     async def on_request(self, request: Request):
         """Handle request before it is sent."""
         pass
 
+    async def aclose(self):
+        """Close the retry client if one was created."""
+        if self._retry_client is not None:
+            await self._retry_client.aclose()
+            self._retry_client = None
+
     async def on_response(self, response: Response) -> Response:
         """Handle response after it is received."""
 
@@ -58,15 +67,16 @@ class HttpxHooks:
             request.headers["X-Payment"] = payment_header
             request.headers["Access-Control-Expose-Headers"] = "X-Payment-Response"
 
-            # Retry the request
-            async with AsyncClient() as client:
-                retry_response = await client.send(request)
+            # Retry the request, reusing a pooled client across retries
+            if self._retry_client is None:
+                self._retry_client = AsyncClient()
+            retry_response = await self._retry_client.send(request)
 
-                # Copy the retry response data to the original response
-                response.status_code = retry_response.status_code
-                response.headers = retry_response.headers
-                response._content = retry_response._content
-                return response
+            # Copy the retry response data to the original response
+            response.status_code = retry_response.status_code
+            response.headers = retry_response.headers
+            response._content = retry_response._content
+            return response
 
         except PaymentError as e:
             self._is_retry = False
@@ -134,3 +144,11 @@ class x402HttpxClient(AsyncClient):
         self.event_hooks = x402_payment_hooks(
             account, max_value, payment_requirements_selector
         )
+
+    async def aclose(self) -> None:
+        """Close the client along with any hook-owned retry clients."""
+        for hook in self.event_hooks.get("response", []):
+            owner = getattr(hook, "__self__", None)
+            if isinstance(owner, HttpxHooks):
+                await owner.aclose()
+        await super().aclose()
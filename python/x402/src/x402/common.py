@@ -1,31 +1,69 @@
+import re
+import sys
 from decimal import Decimal
+from functools import lru_cache
 from typing import List, Optional
 
 from x402.chains import (
+    KNOWN_TOKENS,
+    NETWORK_TO_ID,
     get_chain_id,
     get_token_decimals,
     get_token_name,
     get_token_version,
-    get_default_token_address,
 )
 from x402.types import Price, TokenAmount, PaymentRequirements, PaymentPayload
 
+# Known protocol constants, interned once so equal strings in the matching
+# hot path compare by pointer identity before falling back to memcmp.
+_INTERNED_CONSTANTS = {s: sys.intern(s) for s in (*NETWORK_TO_ID, "exact")}
 
+
+def _intern(value: str) -> str:
+    """Return the interned form of a scheme/network string."""
+    cached = _INTERNED_CONSTANTS.get(value)
+    return cached if cached is not None else sys.intern(value)
+
+
+# Plain decimal magnitudes ("1", "1.12", ".5", "1.") take the integer fast
+# path below; anything else (exponents etc.) falls back to Decimal.
+_PLAIN_MONEY_RE = re.compile(r"\d+(?:\.\d*)?|\.\d+")
+
+
+@lru_cache(maxsize=512)
 def parse_money(amount: str | int, address: str, network: str) -> int:
     """Parse money string or int into int
 
     Params:
         amount: str | int - if int, should be the full amount including token specific decimals
+
+    Results are memoized; the same price strings recur constantly across
+    middleware registrations and requests. Plain decimal strings are parsed
+    with pure integer arithmetic - the sign is handled explicitly and the
+    fractional digits padded to the token's decimal width - which avoids
+    Decimal context setup on the request path; exponent forms keep the
+    Decimal behavior.
     """
     if isinstance(amount, str):
         if amount.startswith("$"):
             amount = amount[1:]
-        decimal_amount = Decimal(amount)
 
         chain_id = get_chain_id(network)
         decimals = get_token_decimals(chain_id, address)
-        decimal_amount = decimal_amount * Decimal(10**decimals)
-        return int(decimal_amount)
+
+        negative = amount.startswith("-")
+        magnitude = amount[1:] if amount[:1] in "+-" else amount
+
+        if _PLAIN_MONEY_RE.fullmatch(magnitude):
+            if "." in magnitude:
+                whole, frac = magnitude.split(".", 1)
+                frac = (frac + "0" * decimals)[:decimals]
+            else:
+                whole, frac = magnitude, ""
+            value = int(whole or "0") * 10**decimals + int(frac or "0")
+            return -value if negative else value
+
+        return int(Decimal(amount) * Decimal(10**decimals))
     return amount
 
 
@@ -45,30 +83,7 @@ def process_price_to_atomic_amount(
         ValueError: If price format is invalid
     """
     if isinstance(price, (str, int)):
-        # Money type - convert USD to USDC atomic units
-        try:
-            if isinstance(price, str) and price.startswith("$"):
-                price = price[1:]
-            amount = Decimal(str(price))
-
-            # Get USDC address for the network
-            chain_id = get_chain_id(network)
-            asset_address = get_usdc_address(chain_id)
-            decimals = get_token_decimals(chain_id, asset_address)
-
-            # Convert to atomic units
-            atomic_amount = int(amount * Decimal(10**decimals))
-
-            # Get EIP-712 domain info
-            eip712_domain = {
-                "name": get_token_name(chain_id, asset_address),
-                "version": get_token_version(chain_id, asset_address),
-            }
-
-            return str(atomic_amount), asset_address, eip712_domain
-
-        except (ValueError, KeyError) as e:
-            raise ValueError(f"Invalid price format: {price}. Error: {e}")
+        return _process_money_price(price, network)
 
     elif isinstance(price, TokenAmount):
         # TokenAmount type - already in atomic units with asset info
@@ -85,10 +100,79 @@ def process_price_to_atomic_amount(
         raise ValueError(f"Invalid price type: {type(price)}")
 
 
+@lru_cache(maxsize=512)
+def _process_money_price(
+    price: str | int, network: str
+) -> tuple[str, str, dict[str, str]]:
+    """Convert a USD money price to USDC atomic units for a network.
+
+    Memoized on the raw (price, network) pair; callers treat the returned
+    EIP-712 domain dict as read-only.
+    """
+    try:
+        if isinstance(price, str) and price.startswith("$"):
+            price = price[1:]
+        amount = Decimal(str(price))
+
+        # Get USDC address for the network
+        chain_id = get_chain_id(network)
+        asset_address = get_usdc_address(chain_id)
+        decimals = get_token_decimals(chain_id, asset_address)
+
+        # Convert to atomic units
+        atomic_amount = int(amount * Decimal(10**decimals))
+
+        # Get EIP-712 domain info
+        eip712_domain = {
+            "name": get_token_name(chain_id, asset_address),
+            "version": get_token_version(chain_id, asset_address),
+        }
+
+        return str(atomic_amount), asset_address, eip712_domain
+
+    except (ValueError, KeyError) as e:
+        raise ValueError(f"Invalid price format: {price}. Error: {e}")
+
+
+# USDC address per chain, materialized once at import so the lookup is a
+# single int cast and dict probe.
+_USDC_BY_CHAIN = {
+    int(chain_id): token["address"]
+    for chain_id, tokens in KNOWN_TOKENS.items()
+    for token in tokens
+    if token["human_name"] == "usdc"
+}
+
+
 def get_usdc_address(chain_id: int | str) -> str:
     """Get the USDC contract address for a given chain ID"""
-    chain_id_str = str(chain_id)  # Convert to string for consistency
-    return get_default_token_address(chain_id_str, "usdc")
+    return _USDC_BY_CHAIN[int(chain_id)]
+
+
+class RequirementsIndex:
+    """Structure-of-arrays view over a list of PaymentRequirements.
+
+    Materializes the scheme and network columns as plain tuples once, so
+    repeated matching against a long-lived accepts list scans interned
+    strings instead of going through pydantic attribute descriptors on
+    every probe.
+    """
+
+    __slots__ = ("_schemes", "_networks", "_reqs")
+
+    def __init__(self, requirements: List[PaymentRequirements]):
+        self._schemes = tuple(_intern(r.scheme) for r in requirements)
+        self._networks = tuple(_intern(r.network) for r in requirements)
+        self._reqs = requirements
+
+    def find(self, scheme: str, network: str) -> Optional[PaymentRequirements]:
+        """Return the first requirement matching scheme and network, if any."""
+        scheme = _intern(scheme)
+        network = _intern(network)
+        for i, (s, n) in enumerate(zip(self._schemes, self._networks)):
+            if s == scheme and n == network:
+                return self._reqs[i]
+        return None
 
 
 def find_matching_payment_requirements(
@@ -105,10 +189,12 @@ def find_matching_payment_requirements(
     Returns:
         The matching payment requirements or None if no match is found
     """
+    # One pass to index, one O(1) probe; setdefault keeps first-match
+    # semantics when duplicate (scheme, network) keys appear.
+    index: dict[tuple[str, str], PaymentRequirements] = {}
     for req in payment_requirements:
-        if req.scheme == payment.scheme and req.network == payment.network:
-            return req
-    return None
+        index.setdefault((_intern(req.scheme), _intern(req.network)), req)
+    return index.get((_intern(payment.scheme), _intern(payment.network)))
 
 
 x402_VERSION = 1
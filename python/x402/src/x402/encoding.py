@@ -1,4 +1,4 @@
-import base64
+import binascii
 from typing import Union
 
 
@@ -13,7 +13,9 @@ def safe_base64_encode(data: Union[str, bytes]) -> str:
     """
     if isinstance(data, str):
         data = data.encode("utf-8")
-    return base64.b64encode(data).decode("utf-8")
+    # b2a_base64 is the C primitive under base64.b64encode, minus the extra
+    # wrapper call and trailing-newline allocation.
+    return binascii.b2a_base64(data, newline=False).decode("ascii")
 
 
 def safe_base64_decode(data: str) -> str:
@@ -25,4 +27,10 @@ def safe_base64_decode(data: str) -> str:
     Returns:
         Decoded utf-8 string
     """
-    return base64.b64decode(data).decode("utf-8")
+    raw = binascii.a2b_base64(data)
+    try:
+        # JSON payment headers are almost always pure ASCII; that decode
+        # skips the UTF-8 state machine entirely.
+        return raw.decode("ascii")
+    except UnicodeDecodeError:
+        return raw.decode("utf-8")
@@ -1,21 +1,50 @@
+import binascii
+import functools
+import os
+import sys
+import threading
 import time
-import secrets
 from typing import Dict, Any
-from typing_extensions import (
-    TypedDict,
-)  # use `typing_extensions.TypedDict` instead of `typing.TypedDict` on Python < 3.12
+
+if sys.version_info >= (3, 12):
+    from typing import TypedDict
+else:
+    # use `typing_extensions.TypedDict` instead of `typing.TypedDict` on Python < 3.12
+    from typing_extensions import TypedDict
 from eth_account import Account
-from x402.encoding import safe_base64_encode, safe_base64_decode
+from hexbytes import HexBytes
+from x402.encoding import safe_base64_encode
 from x402.types import (
     PaymentRequirements,
 )
 from x402.chains import get_chain_id
 import json
 
+try:
+    import orjson
+except ImportError:  # optional speedup, installed via x402[fast]
+    orjson = None
+
+
+# Refill the nonce pool with one urandom syscall per 256 nonces instead of
+# one per signature.
+_NONCE_POOL = bytearray()
+_NONCE_LOCK = threading.Lock()
+
+if hasattr(os, "register_at_fork"):
+    # Forked workers (prefork gunicorn etc.) must not inherit a warm pool,
+    # or parent and children would emit identical nonce sequences.
+    os.register_at_fork(after_in_child=_NONCE_POOL.clear)
+
 
 def create_nonce() -> bytes:
     """Create a random 32-byte nonce for authorization signatures."""
-    return secrets.token_bytes(32)
+    with _NONCE_LOCK:
+        if len(_NONCE_POOL) < 32:
+            _NONCE_POOL.extend(os.urandom(8192))
+        nonce = bytes(_NONCE_POOL[:32])
+        del _NONCE_POOL[:32]
+    return nonce
 
 
 def prepare_payment_header(
@@ -23,8 +52,9 @@ def prepare_payment_header(
 ) -> Dict[str, Any]:
     """Prepare an unsigned payment header with sender address, x402 version, and payment requirements."""
     nonce = create_nonce()
-    valid_after = str(int(time.time()) - 60)  # 60 seconds before
-    valid_before = str(int(time.time()) + payment_requirements.max_timeout_seconds)
+    now = int(time.time())
+    valid_after = str(now - 60)  # 60 seconds before
+    valid_before = str(now + payment_requirements.max_timeout_seconds)
 
     return {
         "x402Version": x402_version,
@@ -44,6 +74,38 @@ def prepare_payment_header(
     }
 
 
+# Static EIP-3009 type schema, hoisted so each signature reuses one
+# read-only structure instead of rebuilding six dicts and a list per call.
+_TRANSFER_WITH_AUTH_TYPES = {
+    "TransferWithAuthorization": [
+        {"name": "from", "type": "address"},
+        {"name": "to", "type": "address"},
+        {"name": "value", "type": "uint256"},
+        {"name": "validAfter", "type": "uint256"},
+        {"name": "validBefore", "type": "uint256"},
+        {"name": "nonce", "type": "bytes32"},
+    ]
+}
+
+
+@functools.lru_cache(maxsize=128)
+def _eip712_domain(
+    name: str, version: str, chain_id: int, verifying_contract: str
+) -> Dict[str, Any]:
+    """Return the EIP-712 domain data for a (token, network) pair.
+
+    The domain depends only on these four values, so signing many payments
+    against the same asset reuses one dict (treated as read-only) instead
+    of rebuilding it - and re-resolving the chain id - per signature.
+    """
+    return {
+        "name": name,
+        "version": version,
+        "chainId": chain_id,
+        "verifyingContract": verifying_contract,
+    }
+
+
 class PaymentHeader(TypedDict):
     x402Version: int
     scheme: str
@@ -60,38 +122,25 @@ def sign_payment_header(
 
         nonce_bytes = bytes.fromhex(auth["nonce"])
 
-        typed_data = {
-            "types": {
-                "TransferWithAuthorization": [
-                    {"name": "from", "type": "address"},
-                    {"name": "to", "type": "address"},
-                    {"name": "value", "type": "uint256"},
-                    {"name": "validAfter", "type": "uint256"},
-                    {"name": "validBefore", "type": "uint256"},
-                    {"name": "nonce", "type": "bytes32"},
-                ]
-            },
-            "primaryType": "TransferWithAuthorization",
-            "domain": {
-                "name": payment_requirements.extra["name"],
-                "version": payment_requirements.extra["version"],
-                "chainId": int(get_chain_id(payment_requirements.network)),
-                "verifyingContract": payment_requirements.asset,
-            },
-            "message": {
-                "from": auth["from"],
-                "to": auth["to"],
-                "value": int(auth["value"]),
-                "validAfter": int(auth["validAfter"]),
-                "validBefore": int(auth["validBefore"]),
-                "nonce": nonce_bytes,
-            },
+        domain_data = _eip712_domain(
+            payment_requirements.extra["name"],
+            payment_requirements.extra["version"],
+            int(get_chain_id(payment_requirements.network)),
+            payment_requirements.asset,
+        )
+        message_data = {
+            "from": auth["from"],
+            "to": auth["to"],
+            "value": int(auth["value"]),
+            "validAfter": int(auth["validAfter"]),
+            "validBefore": int(auth["validBefore"]),
+            "nonce": nonce_bytes,
         }
 
         signed_message = account.sign_typed_data(
-            domain_data=typed_data["domain"],
-            message_types=typed_data["types"],
-            message_data=typed_data["message"],
+            domain_data=domain_data,
+            message_types=_TRANSFER_WITH_AUTH_TYPES,
+            message_data=message_data,
         )
         signature = signed_message.signature.hex()
         if not signature.startswith("0x"):
@@ -107,24 +156,30 @@ def sign_payment_header(
         raise
 
 
+def _json_default(obj):
+    """Serialize HexBytes and hex/to_dict-capable objects for JSON encoding."""
+    if isinstance(obj, HexBytes):
+        # Unbound bytes.hex skips the HexBytes override, yielding the
+        # unprefixed form directly regardless of hexbytes version.
+        return bytes.hex(obj)
+    if hasattr(obj, "to_dict"):
+        return obj.to_dict()
+    if hasattr(obj, "hex"):
+        return obj.hex()
+    raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
+
+
 def encode_payment(payment_payload: Dict[str, Any]) -> str:
     """Encode a payment payload into a base64 string, handling HexBytes and other non-serializable types."""
-    from hexbytes import HexBytes
-
-    def default(obj):
-        if isinstance(obj, HexBytes):
-            return obj.hex()
-        if hasattr(obj, "to_dict"):
-            return obj.to_dict()
-        if hasattr(obj, "hex"):
-            return obj.hex()
-        raise TypeError(
-            f"Object of type {obj.__class__.__name__} is not JSON serializable"
-        )
-
-    return safe_base64_encode(json.dumps(payment_payload, default=default))
+    if orjson is not None:
+        return safe_base64_encode(orjson.dumps(payment_payload, default=_json_default))
+    return safe_base64_encode(json.dumps(payment_payload, default=_json_default))
 
 
 def decode_payment(encoded_payment: str) -> Dict[str, Any]:
     """Decode a base64 encoded payment string back into a PaymentPayload object."""
-    return json.loads(safe_base64_decode(encoded_payment))
+    padded = encoded_payment + "=" * (-len(encoded_payment) % 4)
+    raw = binascii.a2b_base64(padded)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
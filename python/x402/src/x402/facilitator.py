@@ -1,13 +1,19 @@
+import sys
 from typing import Callable, Optional
-from typing_extensions import (
-    TypedDict,
-)  # use `typing_extensions.TypedDict` instead of `typing.TypedDict` on Python < 3.12
+
+if sys.version_info >= (3, 12):
+    from typing import TypedDict
+else:
+    # use `typing_extensions.TypedDict` instead of `typing.TypedDict` on Python < 3.12
+    from typing_extensions import TypedDict
 import httpx
 from x402.types import (
     PaymentPayload,
     PaymentRequirements,
     VerifyResponse,
+    VerifyResponseAdapter,
     SettleResponse,
+    SettleResponseAdapter,
     ListDiscoveryResourcesRequest,
     ListDiscoveryResourcesResponse,
 )
@@ -64,7 +70,7 @@ class FacilitatorClient:
             )
 
             data = response.json()
-            return VerifyResponse(**data)
+            return VerifyResponseAdapter.validate_python(data)
 
     async def settle(
         self, payment: PaymentPayload, payment_requirements: PaymentRequirements
@@ -89,7 +95,7 @@ class FacilitatorClient:
                 follow_redirects=True,
             )
             data = response.json()
-            return SettleResponse(**data)
+            return SettleResponseAdapter.validate_python(data)
 
     async def list(
         self, request: Optional[ListDiscoveryResourcesRequest] = None
@@ -4,7 +4,7 @@ import logging
 from typing import Any, Callable, Optional, get_args, cast
 
 from fastapi import Request
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import HTMLResponse, Response
 from pydantic import validate_call
 
 from x402.common import (
@@ -14,10 +14,10 @@ from x402.common import (
 )
 from x402.encoding import safe_base64_decode
 from x402.facilitator import FacilitatorClient, FacilitatorConfig
-from x402.path import path_is_match
+from x402.path import PathMatcher
 from x402.paywall import is_browser_request, get_paywall_html
 from x402.types import (
-    PaymentPayload,
+    PaymentPayloadAdapter,
     PaymentRequirements,
     Price,
     x402PaymentRequiredResponse,
@@ -88,17 +88,27 @@ def require_payment(
 
     facilitator = FacilitatorClient(facilitator_config)
 
+    # Compile the path patterns once when the middleware is built instead
+    # of re-classifying them on every request.
+    path_matcher = PathMatcher(path)
+
+    # Rendered paywall HTML only depends on the error message and the
+    # per-request requirement fields, so cache it per (error, resource,
+    # method) with a small cap to bound memory on high-cardinality URLs.
+    paywall_html_cache: dict[tuple[str, str, str], str] = {}
+
     async def middleware(request: Request, call_next: Callable):
         # Skip if the path is not the same as the path in the middleware
-        if not path_is_match(path, request.url.path):
+        if not path_matcher.matches(request.url.path):
             return await call_next(request)
 
         # Get resource URL if not explicitly provided
         resource_url = resource or str(request.url)
 
-        # Construct payment details
+        # Construct payment details. Field values were validated when the
+        # middleware was registered, so skip per-request re-validation.
         payment_requirements = [
-            PaymentRequirements(
+            PaymentRequirements.model_construct(
                 scheme="exact",
                 network=cast(SupportedNetworks, network),
                 asset=asset_address,
@@ -126,13 +136,19 @@ def require_payment(
 
         def x402_response(error: str):
             """Create a 402 response with payment requirements."""
-            request_headers = dict(request.headers)
             status_code = 402
 
-            if is_browser_request(request_headers):
-                html_content = custom_paywall_html or get_paywall_html(
-                    error, payment_requirements, paywall_config
-                )
+            # Starlette headers are already a decoded mapping; no need to
+            # copy them into a dict just to probe two keys.
+            if is_browser_request(request.headers):
+                cache_key = (error, resource_url, request.method)
+                html_content = paywall_html_cache.get(cache_key)
+                if html_content is None:
+                    html_content = custom_paywall_html or get_paywall_html(
+                        error, payment_requirements, paywall_config
+                    )
+                    if len(paywall_html_cache) < 32:
+                        paywall_html_cache[cache_key] = html_content
                 headers = {"Content-Type": "text/html; charset=utf-8"}
 
                 return HTMLResponse(
@@ -141,17 +157,19 @@ def require_payment(
                     headers=headers,
                 )
             else:
-                response_data = x402PaymentRequiredResponse(
+                # Serialize straight to JSON in one pydantic-core pass;
+                # dumping to an intermediate dict for JSONResponse to
+                # re-serialize was pure overhead.
+                body = x402PaymentRequiredResponse(
                     x402_version=x402_VERSION,
                     accepts=payment_requirements,
                     error=error,
-                ).model_dump(by_alias=True)
-                headers = {"Content-Type": "application/json"}
+                ).model_dump_json(by_alias=True)
 
-                return JSONResponse(
-                    content=response_data,
+                return Response(
+                    content=body,
                     status_code=status_code,
-                    headers=headers,
+                    media_type="application/json",
                 )
 
         # Check for payment header
@@ -163,7 +181,7 @@ def require_payment(
         # Decode payment header
         try:
             payment_dict = json.loads(safe_base64_decode(payment_header))
-            payment = PaymentPayload(**payment_dict)
+            payment = PaymentPayloadAdapter.validate_python(payment_dict)
         except Exception as e:
             logger.warning(
                 f"Invalid payment header format from {request.client.host if request.client else 'unknown'}: {str(e)}"
@@ -1,11 +1,13 @@
+import asyncio
 import base64
 import json
+import threading
 from typing import Any, Dict, Optional, Union, get_args, cast
 from flask import Flask, request, g
-from x402.path import path_is_match
+from x402.path import PathMatcher
 from x402.types import (
     Price,
-    PaymentPayload,
+    PaymentPayloadAdapter,
     PaymentRequirements,
     x402PaymentRequiredResponse,
     PaywallConfig,
@@ -41,6 +43,21 @@ class ResponseWrapper:
         self.headers.append((name, value))
 
 
+# Per-worker-thread event loop, pooled across requests so the verify and
+# settle facilitator calls don't pay loop setup/teardown on the hot path.
+_loop_local = threading.local()
+
+
+def _get_event_loop() -> asyncio.AbstractEventLoop:
+    """Return this thread's reusable event loop for facilitator calls."""
+    loop = getattr(_loop_local, "loop", None)
+    if loop is None or loop.is_closed():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        _loop_local.loop = loop
+    return loop
+
+
 class PaymentMiddleware:
     """
     Flask middleware for x402 payment requirements.
@@ -144,11 +161,20 @@ class PaymentMiddleware:
 
         facilitator = FacilitatorClient(config["facilitator_config"])
 
+        # Index the path patterns once at registration so per-request
+        # dispatch is a set probe plus precompiled pattern checks.
+        path_matcher = PathMatcher(config["path"])
+
+        # 402 JSON bodies only vary with the error, resource URL and method
+        # for a given config, so cache the serialized bytes per triple with
+        # a small cap to bound memory on high-cardinality URLs.
+        json_body_cache: dict[tuple[str, str, str], bytes] = {}
+
         def middleware(environ, start_response):
             # Create Flask request context
             with self.app.request_context(environ):
                 # Skip if the path is not the same as the path in the middleware
-                if not path_is_match(config["path"], request.path):
+                if not path_matcher.matches(request.path):
                     return next_app(environ, start_response)
 
                 # Get resource URL if not explicitly provided
@@ -160,9 +186,10 @@ class PaymentMiddleware:
                     # Fallback to request.url if the header is not present
                     resource_url = config["resource"] or request.url
 
-                # Construct payment details
+                # Construct payment details. Field values were validated at
+                # registration time, so skip per-request re-validation.
                 payment_requirements = [
-                    PaymentRequirements(
+                    PaymentRequirements.model_construct(
                         scheme="exact",
                         network=cast(SupportedNetworks, config["network"]),
                         asset=asset_address,
@@ -192,10 +219,11 @@ class PaymentMiddleware:
 
                 def x402_response(error: str):
                     """Create a 402 response with payment requirements."""
-                    request_headers = dict(request.headers)
                     status = "402 Payment Required"
 
-                    if is_browser_request(request_headers):
+                    # Probe the WSGI header mapping directly rather than
+                    # materializing every header into a dict first.
+                    if is_browser_request(request.headers):
                         html_content = config[
                             "custom_paywall_html"
                         ] or get_paywall_html(
@@ -206,19 +234,28 @@ class PaymentMiddleware:
                         start_response(status, headers)
                         return [html_content.encode("utf-8")]
                     else:
-                        response_data = x402PaymentRequiredResponse(
-                            x402_version=x402_VERSION,
-                            accepts=payment_requirements,
-                            error=error,
-                        ).model_dump(by_alias=True)
+                        cache_key = (error, resource_url, request.method)
+                        body = json_body_cache.get(cache_key)
+                        if body is None:
+                            body = (
+                                x402PaymentRequiredResponse(
+                                    x402_version=x402_VERSION,
+                                    accepts=payment_requirements,
+                                    error=error,
+                                )
+                                .model_dump_json(by_alias=True)
+                                .encode("utf-8")
+                            )
+                            if len(json_body_cache) < 32:
+                                json_body_cache[cache_key] = body
 
                         headers = [
                             ("Content-Type", "application/json"),
-                            ("Content-Length", str(len(json.dumps(response_data)))),
+                            ("Content-Length", str(len(body))),
                         ]
 
                         start_response(status, headers)
-                        return [json.dumps(response_data).encode("utf-8")]
+                        return [body]
 
                 # Check for payment header
                 payment_header = request.headers.get("X-PAYMENT", "")
@@ -229,7 +266,7 @@ class PaymentMiddleware:
                 # Decode payment header
                 try:
                     payment_dict = json.loads(safe_base64_decode(payment_header))
-                    payment = PaymentPayload(**payment_dict)
+                    payment = PaymentPayloadAdapter.validate_python(payment_dict)
                 except Exception as e:
                     return x402_response(f"Invalid payment header format: {str(e)}")
 
@@ -242,16 +279,9 @@ class PaymentMiddleware:
                     return x402_response("No matching payment requirements found")
 
                 # Verify payment (async call in sync context)
-                import asyncio
-
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    verify_response = loop.run_until_complete(
-                        facilitator.verify(payment, selected_payment_requirements)
-                    )
-                finally:
-                    loop.close()
+                verify_response = _get_event_loop().run_until_complete(
+                    facilitator.verify(payment, selected_payment_requirements)
+                )
 
                 if not verify_response.is_valid:
                     error_reason = verify_response.invalid_reason or "Unknown error"
@@ -275,9 +305,7 @@ class PaymentMiddleware:
                 ):
                     # Settle the payment for successful responses
                     try:
-                        loop = asyncio.new_event_loop()
-                        asyncio.set_event_loop(loop)
-                        settle_response = loop.run_until_complete(
+                        settle_response = _get_event_loop().run_until_complete(
                             facilitator.settle(payment, selected_payment_requirements)
                         )
 
@@ -298,8 +326,6 @@ class PaymentMiddleware:
                     except Exception as e:
                         # Log the error but don't try to return a new response
                         print(f"Settle failed: {str(e)}")
-                    finally:
-                        loop.close()
 
                 return response
 
@@ -1,8 +1,46 @@
 import fnmatch
+import functools
 import re
 from typing import Union
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regex/glob path pattern once and cache the result.
+
+    Patterns are reused across requests, so caching turns pattern parsing
+    from per-call work into a one-time cost per distinct pattern.
+    """
+    if pattern.startswith("regex:"):
+        return re.compile(pattern[6:])  # Remove 'regex:' prefix
+    return re.compile(fnmatch.translate(pattern))
+
+
+class PathMatcher:
+    """Pre-indexed matcher for a fixed set of path patterns.
+
+    Built once at registration time: literal patterns go into a set probed
+    in O(1), while glob and regex patterns are compiled up front and only
+    scanned when the literal probe misses. Matching semantics are identical
+    to path_is_match.
+    """
+
+    def __init__(self, path: Union[str, list[str]]):
+        patterns = [path] if isinstance(path, str) else path
+        self._literals: set[str] = set()
+        self._compiled: list[re.Pattern] = []
+        for pattern in patterns:
+            if pattern.startswith("regex:") or "*" in pattern or "?" in pattern:
+                self._compiled.append(_compile_pattern(pattern))
+            else:
+                self._literals.add(pattern)
+
+    def matches(self, request_path: str) -> bool:
+        if request_path in self._literals:
+            return True
+        return any(pattern.match(request_path) for pattern in self._compiled)
+
+
 def path_is_match(path: Union[str, list[str]], request_path: str) -> bool:
     """
     Check if request path matches the specified path pattern(s).
@@ -24,12 +62,11 @@ def path_is_match(path: Union[str, list[str]], request_path: str) -> bool:
     def single_path_match(pattern: str) -> bool:
         # Regex pattern
         if pattern.startswith("regex:"):
-            regex_pattern = pattern[6:]  # Remove 'regex:' prefix
-            return bool(re.match(regex_pattern, request_path))
+            return bool(_compile_pattern(pattern).match(request_path))
 
         # Glob pattern (contains * or ?)
         elif "*" in pattern or "?" in pattern:
-            return fnmatch.fnmatch(request_path, pattern)
+            return bool(_compile_pattern(pattern).match(request_path))
 
         # Exact match
         else:
@@ -1,38 +1,162 @@
+import functools
 import json
-from typing import Dict, Any, List, Optional
+import re
+import sys
+from typing import Dict, Any, List, Mapping, Optional
 
-from x402.types import PaymentRequirements, PaywallConfig
+from x402.types import PaymentRequirements, PaymentRequirementsListAdapter
+
+try:
+    import orjson
+except ImportError:  # optional speedup, installed via x402[fast]
+    orjson = None
 from x402.common import x402_VERSION
 from x402.template import PAYWALL_TEMPLATE
 
+# Pre-interned config keys so the per-request lookups below collapse to
+# pointer comparisons (string literals at call sites are auto-interned).
+_CDP_CLIENT_KEY = sys.intern("cdp_client_key")
+_APP_NAME = sys.intern("app_name")
+_APP_LOGO = sys.intern("app_logo")
+_SESSION_TOKEN_ENDPOINT = sys.intern("session_token_endpoint")
+
+# The paywall template ships as an import-time string constant in
+# x402.template - there is no per-request disk or importlib.resources
+# load to cache. Split it around the script injection point once at
+# import, so rendering the default paywall is pure concatenation.
+_TEMPLATE_HEAD, _TEMPLATE_TAIL = PAYWALL_TEMPLATE.split("</head>", 1)
+
+# Script-tag shells for the two testnet branches, fixed at import; rendering
+# picks one and substitutes the config blob with a single replace instead of
+# re-assembling the tag per call. The mainnet shell keeps the blank line the
+# f-string form emitted so rendered output is byte-identical.
+_SCRIPT_TESTNET = (
+    "\n  <script>\n    window.x402 = {cfg};\n"
+    "    console.log('Payment requirements initialized:', window.x402);\n"
+    "  </script>"
+)
+_SCRIPT_MAINNET = "\n  <script>\n    window.x402 = {cfg};\n    \n  </script>"
+
+
+# Networks the paywall treats as testnets (enables the console logging in
+# the injected script); frozenset membership is one C-level hash probe.
+_TESTNET_NETWORKS = frozenset({"bsc-mainnet", "avalanche-fuji"})
+
+# Display-amount divisor per asset address; anything unknown is assumed to
+# be USDC-style six decimals, matching the conversion comment below.
+_ASSET_SCALE: Dict[str, int] = {}
+_DEFAULT_SCALE = 1_000_000
+
+
+@functools.lru_cache(maxsize=1024)
+def _amount_to_float(amount: str, scale: int) -> float:
+    """Convert an atomic amount string to display units, memoized.
+
+    The same handful of amounts repeats across requests, so cache the
+    parse + division per (amount, scale) pair.
+    """
+    try:
+        value = int(amount)
+    except ValueError:
+        value = float(amount)
+    return value / scale
+
+
+# Compiled once; case-insensitive search on the raw header values avoids
+# per-call .lower() allocations and lets the C regex engine do the scan.
+_HTML_RE = re.compile(r"text/html", re.IGNORECASE)
+
+# All User-Agent tokens in one alternation so the string is scanned once
+# no matter how many classification tokens are added. Bot markers veto the
+# generic Mozilla marker that most crawlers also carry.
+_UA_CLASS_RE = re.compile(
+    r"(?P<bot>bot\b|crawler|spider|curl/|wget/|python-requests)"
+    r"|(?P<browser>mozilla)",
+    re.IGNORECASE,
+)
 
-def is_browser_request(headers: Dict[str, Any]) -> bool:
+
+@functools.lru_cache(maxsize=1024)
+def _negotiate_browser(accept_header: str, user_agent: str) -> bool:
+    """Decide browser vs API client for one Accept/User-Agent pair.
+
+    Real traffic repeats the same header pair constantly, so the regex
+    scans are memoized per pair.
+    """
+    if not _HTML_RE.search(accept_header):
+        return False
+    is_browser = False
+    for match in _UA_CLASS_RE.finditer(user_agent):
+        if match.lastgroup == "bot":
+            return False
+        is_browser = True
+    return is_browser
+
+
+def is_browser_request(headers: Mapping[str, Any]) -> bool:
     """
     Determine if request is from a browser vs API client.
 
     Args:
-        headers: Dictionary of request headers (case-insensitive keys)
+        headers: Mapping of request headers (case-insensitive keys)
 
     Returns:
         True if request appears to be from a browser, False otherwise
     """
-    headers_lower = {k.lower(): v for k, v in headers.items()}
-    accept_header = headers_lower.get("accept", "")
-    user_agent = headers_lower.get("user-agent", "")
+    # Framework header mappings (Starlette, Werkzeug) resolve lowercase
+    # keys case-insensitively, so two direct probes usually suffice.
+    accept_header = headers.get("accept", "")
+    user_agent = headers.get("user-agent", "")
 
-    if "text/html" in accept_header and "Mozilla" in user_agent:
-        return True
+    if not accept_header or not user_agent:
+        # Plain dicts with mixed-case keys miss the probes above; fall
+        # back to a single pass, lowercasing each key exactly once.
+        accept_header = user_agent = ""
+        for key, value in headers.items():
+            lower_key = key.lower()
+            if lower_key == "accept":
+                accept_header = value
+            elif lower_key == "user-agent":
+                user_agent = value
 
-    return False
+    return _negotiate_browser(accept_header, user_agent)
 
 
 def create_x402_config(
     error: str,
     payment_requirements: List[PaymentRequirements],
-    paywall_config: Optional[PaywallConfig] = None,
+    paywall_config: Optional[Mapping[str, str]] = None,
 ) -> Dict[str, Any]:
-    """Create x402 configuration object from payment requirements."""
+    """Create x402 configuration object from payment requirements.
+
+    Identical inputs recur constantly for a paywalled resource, so results
+    are memoized when the arguments are hashable; callers must treat the
+    returned dict as read-only. Requirements carrying dict-valued fields
+    (output_schema/extra) are not hashable and fall back to a fresh build.
+    """
+    config_items = tuple(sorted(paywall_config.items())) if paywall_config else ()
+    try:
+        return _x402_config_cached(error, tuple(payment_requirements), config_items)
+    except TypeError:
+        return _build_x402_config(error, payment_requirements, paywall_config)
+
+
+@functools.lru_cache(maxsize=512)
+def _x402_config_cached(
+    error: str,
+    payment_requirements: tuple,
+    config_items: tuple,
+) -> Dict[str, Any]:
+    return _build_x402_config(
+        error, list(payment_requirements), dict(config_items) if config_items else None
+    )
+
 
+def _build_x402_config(
+    error: str,
+    payment_requirements: List[PaymentRequirements],
+    paywall_config: Optional[Mapping[str, str]] = None,
+) -> Dict[str, Any]:
     requirements = payment_requirements[0] if payment_requirements else None
     display_amount = 0
     current_url = ""
@@ -40,15 +164,14 @@ def create_x402_config(
 
     if requirements:
         # Convert atomic amount back to USD (assuming USDC with 6 decimals)
+        scale = _ASSET_SCALE.get(requirements.asset, _DEFAULT_SCALE)
         try:
-            display_amount = (
-                float(requirements.max_amount_required) / 1000000
-            )  # USDC has 6 decimals
+            display_amount = _amount_to_float(requirements.max_amount_required, scale)
         except (ValueError, TypeError):
             display_amount = 0
 
         current_url = requirements.resource or ""
-        testnet = requirements.network == "bsc-mainnet"
+        testnet = requirements.network in _TESTNET_NETWORKS
 
     # Get paywall config values or defaults
     config = paywall_config or {}
@@ -56,52 +179,87 @@ def create_x402_config(
     # Create the window.x402 configuration object
     return {
         "amount": display_amount,
-        "paymentRequirements": [
-            req.model_dump(by_alias=True) for req in payment_requirements
-        ],
+        "paymentRequirements": PaymentRequirementsListAdapter.dump_python(
+            payment_requirements, by_alias=True
+        ),
         "testnet": testnet,
         "currentUrl": current_url,
         "error": error,
         "x402_version": x402_VERSION,
-        "cdpClientKey": config.get("cdp_client_key", ""),
-        "appName": config.get("app_name", ""),
-        "appLogo": config.get("app_logo", ""),
-        "sessionTokenEndpoint": config.get("session_token_endpoint", ""),
+        "cdpClientKey": config.get(_CDP_CLIENT_KEY, ""),
+        "appName": config.get(_APP_NAME, ""),
+        "appLogo": config.get(_APP_LOGO, ""),
+        "sessionTokenEndpoint": config.get(_SESSION_TOKEN_ENDPOINT, ""),
     }
 
 
-def inject_payment_data(
-    html_content: str,
+def _create_config_script(
     error: str,
     payment_requirements: List[PaymentRequirements],
-    paywall_config: Optional[PaywallConfig] = None,
+    paywall_config: Optional[Mapping[str, str]] = None,
 ) -> str:
-    """Inject payment requirements into HTML as JavaScript variables."""
+    """Build the window.x402 configuration script tag."""
 
-    # Create x402 configuration object
     x402_config = create_x402_config(error, payment_requirements, paywall_config)
 
+    # orjson's C encoder is several times faster than stdlib json on this
+    # dict-of-primitives payload; OPT_INDENT_2 keeps the key/value spacing
+    # that stdlib json.dumps emits.
+    if orjson is not None:
+        config_json = orjson.dumps(x402_config, option=orjson.OPT_INDENT_2).decode()
+    else:
+        config_json = json.dumps(x402_config)
+
     # Create the configuration script (matching TypeScript pattern)
-    log_on_testnet = (
-        "console.log('Payment requirements initialized:', window.x402);"
-        if x402_config["testnet"]
-        else ""
-    )
+    template = _SCRIPT_TESTNET if x402_config["testnet"] else _SCRIPT_MAINNET
+    return template.replace("{cfg}", config_json, 1)
 
-    config_script = f"""
-  <script>
-    window.x402 = {json.dumps(x402_config)};
-    {log_on_testnet}
-  </script>"""
+
+def inject_payment_data(
+    html_content: str,
+    error: str,
+    payment_requirements: List[PaymentRequirements],
+    paywall_config: Optional[Mapping[str, str]] = None,
+) -> str:
+    """Inject payment requirements into HTML as JavaScript variables."""
+
+    # One partition call both locates the head close tag and splits the
+    # document; an empty separator doubles as the no-injection-point guard,
+    # bailing before paying for config serialization at all.
+    head, sep, tail = html_content.partition("</head>")
+    if not sep:
+        return html_content
+
+    config_script = _create_config_script(error, payment_requirements, paywall_config)
 
     # Inject the configuration script into the head (same as TypeScript)
-    return html_content.replace("</head>", f"{config_script}\n</head>")
+    return f"{head}{config_script}\n{sep}{tail}"
+
+
+def inject_payment_data_bytes(
+    html_content: bytes,
+    error: str,
+    payment_requirements: List[PaymentRequirements],
+    paywall_config: Optional[Mapping[str, str]] = None,
+) -> bytes:
+    """Bytes variant of inject_payment_data for wire-bound bodies.
+
+    Splits around the head close tag with one partition call and joins the
+    pieces directly, so only the script tag is encoded - the document
+    never round-trips through an intermediate str.
+    """
+    head, sep, tail = html_content.partition(b"</head>")
+    if not sep:
+        return html_content
+
+    config_script = _create_config_script(error, payment_requirements, paywall_config)
+    return b"".join((head, config_script.encode("utf-8"), b"\n", sep, tail))
 
 
 def get_paywall_html(
     error: str,
     payment_requirements: List[PaymentRequirements],
-    paywall_config: Optional[PaywallConfig] = None,
+    paywall_config: Optional[Mapping[str, str]] = None,
 ) -> str:
     """
     Load paywall HTML and inject payment data.
@@ -114,6 +272,7 @@ def get_paywall_html(
     Returns:
         Complete HTML with injected payment data
     """
-    return inject_payment_data(
-        PAYWALL_TEMPLATE, error, payment_requirements, paywall_config
-    )
+    # The bundled template is static, so the pre-split halves avoid
+    # re-scanning it for </head> on every 402.
+    config_script = _create_config_script(error, payment_requirements, paywall_config)
+    return f"{_TEMPLATE_HEAD}{config_script}\n</head>{_TEMPLATE_TAIL}"
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from enum import Enum
 from typing import Any, Optional, Union, Dict, Literal, List
-from typing_extensions import (
-    TypedDict,
-)  # use `typing_extensions.TypedDict` instead of `typing.TypedDict` on Python < 3.12
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+if sys.version_info >= (3, 12):
+    from typing import TypedDict
+else:
+    # use `typing_extensions.TypedDict` instead of `typing.TypedDict` on Python < 3.12
+    from typing_extensions import TypedDict
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, field_validator
 from pydantic.alias_generators import to_camel
 
 from x402.networks import SupportedNetworks
@@ -110,6 +114,8 @@ class PaymentRequirements(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        frozen=True,  # hashable and safe to share across requests
+        extra="forbid",  # keep instances lean in large discovery listings
     )
 
     @field_validator("max_amount_required")
@@ -133,6 +139,7 @@ class x402PaymentRequiredResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        frozen=True,  # read-only after parse
     )
 
 
@@ -140,6 +147,14 @@ class ExactPaymentPayload(BaseModel):
     signature: str
     authorization: EIP3009Authorization
 
+    model_config = ConfigDict(
+        alias_generator=to_camel,
+        populate_by_name=True,
+        from_attributes=True,
+        frozen=True,  # read-only after parse
+        extra="forbid",  # reject unexpected fields in signed envelopes
+    )
+
 
 class EIP3009Authorization(BaseModel):
     from_: str = Field(alias="from")
@@ -153,6 +168,8 @@ class EIP3009Authorization(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        frozen=True,  # read-only after parse
+        extra="forbid",  # reject unexpected fields in signed envelopes
     )
 
     @field_validator("value")
@@ -173,6 +190,7 @@ class VerifyResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        frozen=True,  # read-only after parse
     )
 
 
@@ -187,6 +205,7 @@ class SettleResponse(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        frozen=True,  # read-only after parse
     )
 
 
@@ -210,6 +229,10 @@ class PaymentPayload(BaseModel):
 class X402Headers(BaseModel):
     x_payment: str
 
+    model_config = ConfigDict(
+        frozen=True,  # read-only after parse
+    )
+
 
 class UnsupportedSchemeException(Exception):
     pass
@@ -242,6 +265,7 @@ class DiscoveredResource(BaseModel):
         alias_generator=to_camel,
         populate_by_name=True,
         from_attributes=True,
+        extra="forbid",  # keep instances lean in large discovery listings
     )
 
 
@@ -285,3 +309,47 @@ class ListDiscoveryResourcesResponse(BaseModel):
         populate_by_name=True,
         from_attributes=True,
     )
+
+
+# Build all validators/serializers eagerly so the first request in a process
+# doesn't pay pydantic's lazy schema-compile cost, and intern the short
+# camelCase alias strings so repeated by_alias dumps and downstream JSON
+# encoders share one object per key.
+for _model in (
+    HTTPInputSchema,
+    HTTPRequestStructure,
+    TokenAmount,
+    TokenAsset,
+    EIP712Domain,
+    PaymentRequirements,
+    x402PaymentRequiredResponse,
+    ExactPaymentPayload,
+    EIP3009Authorization,
+    VerifyResponse,
+    SettleResponse,
+    PaymentPayload,
+    X402Headers,
+    DiscoveredResource,
+    ListDiscoveryResourcesRequest,
+    DiscoveryResourcesPagination,
+    ListDiscoveryResourcesResponse,
+):
+    _model.model_rebuild()
+    for _field in _model.model_fields.values():
+        if _field.alias:
+            sys.intern(_field.alias)
+        if _field.serialization_alias:
+            sys.intern(_field.serialization_alias)
+del _model
+
+# Shared TypeAdapters for the request-boundary models. validate_python on
+# these routes straight into the compiled pydantic-core validator, skipping
+# Python-level __init__ overhead on every RPC round-trip.
+PaymentRequirementsAdapter = TypeAdapter(PaymentRequirements)
+# Batch form: dump_python/dump_json on this adapter serializes a whole
+# accepts array in one pydantic-core (Rust) pass - use it instead of
+# per-item model_dump loops when emitting many requirements.
+PaymentRequirementsListAdapter = TypeAdapter(List[PaymentRequirements])
+PaymentPayloadAdapter = TypeAdapter(PaymentPayload)
+VerifyResponseAdapter = TypeAdapter(VerifyResponse)
+SettleResponseAdapter = TypeAdapter(SettleResponse)
@@ -0,0 +1,88 @@
+"""msgspec-based mirrors of the discovery types for serde-heavy hot paths.
+
+Discovery listings can carry thousands of items; msgspec decodes and
+validates schematic JSON several times faster than pydantic. The pydantic
+models in ``x402.types`` remain the user-facing API — use these structs when
+round-tripping large payloads and convert at the boundary if needed.
+
+Requires the optional ``msgspec`` dependency (``pip install x402[fast]``).
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Optional
+
+import msgspec
+
+
+class PaymentRequirementsFast(msgspec.Struct, rename="camel"):
+    scheme: str
+    network: str
+    max_amount_required: str
+    resource: str
+    description: str
+    mime_type: str
+    pay_to: str
+    max_timeout_seconds: int
+    asset: str
+    output_schema: Optional[Any] = None
+    extra: Optional[dict[str, Any]] = None
+
+
+class EIP3009AuthorizationFast(msgspec.Struct, rename="camel"):
+    from_: str = msgspec.field(name="from")
+    to: str
+    value: str
+    valid_after: str
+    valid_before: str
+    nonce: str
+
+
+class ExactPaymentPayloadFast(msgspec.Struct, rename="camel"):
+    signature: str
+    authorization: EIP3009AuthorizationFast
+
+
+class PaymentPayloadFast(msgspec.Struct, rename="camel"):
+    x402_version: int
+    scheme: str
+    network: str
+    payload: ExactPaymentPayloadFast
+
+
+class DiscoveredResourceFast(msgspec.Struct, rename="camel"):
+    resource: str
+    type: str
+    x402_version: int
+    accepts: list[PaymentRequirementsFast]
+    last_updated: datetime
+    metadata: Optional[dict] = None
+
+
+class DiscoveryResourcesPaginationFast(msgspec.Struct, rename="camel"):
+    limit: int
+    offset: int
+    total: int
+
+
+class ListDiscoveryResourcesResponseFast(msgspec.Struct, rename="camel"):
+    x402_version: int
+    items: list[DiscoveredResourceFast]
+    pagination: DiscoveryResourcesPaginationFast
+
+
+# Reusable codec instances — building a Decoder/Encoder is not free, so share
+# one per process.
+list_discovery_decoder = msgspec.json.Decoder(ListDiscoveryResourcesResponseFast)
+payment_payload_decoder = msgspec.json.Decoder(PaymentPayloadFast)
+json_encoder = msgspec.json.Encoder()
+
+
+def to_msgspec(model: Any, struct_type: type) -> Any:
+    """Bridge a pydantic model to its msgspec mirror struct.
+
+    Round-trips through the model's aliased dict form, so nested models
+    convert along with their parent.
+    """
+    return msgspec.convert(model.model_dump(by_alias=True), type=struct_type)
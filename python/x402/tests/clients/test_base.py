@@ -7,8 +7,10 @@ from x402.clients.base import (
     PaymentAmountExceededError,
     UnsupportedSchemeException,
     decode_x_payment_response,
+    decode_x_payment_response_typed,
 )
-from x402.types import PaymentRequirements
+from pydantic import ValidationError
+from x402.types import PaymentRequirements, SettleResponse
 from x402.exact import decode_payment
 
 
@@ -22,8 +24,9 @@ def client(account):
     return x402Client(account)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def payment_requirements():
+    # PaymentRequirements is frozen, so one instance is safe to share
     return PaymentRequirements(
         scheme="exact",
         network="bsc-mainnet",
@@ -69,6 +72,39 @@ def test_decode_x_payment_response():
     assert decoded == response  # Should still decode but with missing fields
 
 
+def test_decode_x_payment_response_typed():
+    # Test valid response
+    response = {
+        "success": True,
+        "transaction": "0x1234",
+        "network": "bsc-mainnet",
+        "payer": "0x5678",
+    }
+    encoded = base64.b64encode(json.dumps(response).encode()).decode()
+    decoded = decode_x_payment_response_typed(encoded)
+    assert isinstance(decoded, SettleResponse)
+    assert decoded.success is True
+    assert decoded.transaction == "0x1234"
+    assert decoded.network == "bsc-mainnet"
+    assert decoded.payer == "0x5678"
+
+    # Test invalid base64 (validate=True rejects non-alphabet input)
+    with pytest.raises(Exception):
+        decode_x_payment_response_typed("invalid base64!")
+
+    # Test invalid JSON (surfaces as pydantic ValidationError, not
+    # JSONDecodeError like the untyped sibling)
+    with pytest.raises(ValidationError):
+        decode_x_payment_response_typed(base64.b64encode(b"invalid json").decode())
+
+    # Test missing optional fields still validates
+    response = {"success": True}
+    encoded = base64.b64encode(json.dumps(response).encode()).decode()
+    decoded = decode_x_payment_response_typed(encoded)
+    assert decoded.success is True
+    assert decoded.transaction is None
+
+
 def test_client_initialization(account):
     # Test basic initialization
     client = x402Client(account)
@@ -94,11 +130,8 @@ def test_generate_nonce(client):
     # Test nonce is a string
     assert isinstance(nonce, str)
 
-    # Test nonce length (32 bytes = 64 hex chars)
-    assert len(nonce) == 64
-
-    # Test nonce is hex
-    assert all(c in "0123456789abcdef" for c in nonce)
+    # Test nonce is 32 bytes of hex (bytes.fromhex raises on non-hex input)
+    assert len(bytes.fromhex(nonce)) == 32
 
     # Test nonces are random
     nonce2 = client.generate_nonce()
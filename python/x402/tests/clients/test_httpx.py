@@ -16,8 +16,9 @@ def account():
     return Account.create()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def payment_requirements():
+    # PaymentRequirements is frozen, so one instance is safe to share
     return PaymentRequirements(
         scheme="exact",
         network="bsc-mainnet",
@@ -140,7 +141,9 @@ async def test_on_response_payment_flow(hooks, payment_requirements):
 
 async def test_on_response_payment_error(hooks, payment_requirements):
     # Mock the payment required response with unsupported scheme
-    payment_requirements.scheme = "unsupported"
+    payment_requirements = payment_requirements.model_copy(
+        update={"scheme": "unsupported"}
+    )
     payment_response = x402PaymentRequiredResponse(
         x402_version=1,
         accepts=[payment_requirements],
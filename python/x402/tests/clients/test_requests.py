@@ -1,8 +1,10 @@
 import pytest
-import json
 import base64
+import orjson
 from unittest.mock import MagicMock, patch
 from requests import Response, PreparedRequest, Session
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
 from eth_account import Account
 from x402.clients.requests import (
     x402HTTPAdapter,
@@ -15,22 +17,40 @@ from x402.clients.base import (
 from x402.types import PaymentRequirements, x402PaymentRequiredResponse
 
 
-@pytest.fixture
+# account, payment_requirements and session are shared across the module;
+# the adapter fixture stays function-scoped because tests mutate adapter
+# state and patch send.
+@pytest.fixture(scope="module")
 def account():
-    return Account.create()
+    # Signing is mocked in these tests, so a fixed key avoids the OS-random
+    # seeding + secp256k1 keygen that Account.create() performs.
+    return Account.from_key(bytes.fromhex("01" * 32))
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def session(account):
+    # Session() mounts two adapters, each with its own connection pool;
+    # build it once and undo per-test mutations below.
     return x402_requests(account)
 
 
+@pytest.fixture(autouse=True)
+def _reset_session_state(session):
+    saved_adapters = dict(session.adapters)
+    yield
+    session.adapters.clear()
+    session.adapters.update(saved_adapters)
+    for mounted in session.adapters.values():
+        if isinstance(mounted, x402HTTPAdapter):
+            mounted._is_retry = False
+
+
 @pytest.fixture
 def adapter(account):
     return x402_http_adapter(account)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def payment_requirements():
     return PaymentRequirements(
         scheme="exact",
@@ -50,78 +70,140 @@ def payment_requirements():
     )
 
 
+@pytest.fixture(scope="module")
+def payment_required_body(payment_requirements):
+    # Serialize the 402 body once for the module; model_dump_json runs
+    # pydantic's Rust serializer in one pass, with no intermediate dict.
+    payment_response = x402PaymentRequiredResponse(
+        x402_version=1,
+        accepts=[payment_requirements],
+        error="Payment Required",
+    )
+    return payment_response.model_dump_json(by_alias=True).encode()
+
+
+@pytest.fixture(scope="module")
+def base_prepared_request():
+    # URL parsing and header normalization in prepare() are identical for
+    # every test; prepare once and hand out copies.
+    r = PreparedRequest()
+    r.prepare("GET", "https://example.com")
+    return r
+
+
+@pytest.fixture(scope="module")
+def payment_response_header():
+    # Encode the settle-result header once for the module.
+    return base64.b64encode(
+        orjson.dumps(
+            {
+                "success": True,
+                "transaction": "0x1234",
+                "network": "bsc-mainnet",
+                "payer": "0x5678",
+            }
+        )
+    ).decode()
+
+
+def mkresp(status, content=b"", headers=None):
+    """Build a Response without __init__'s CookieJar/headers setup; only the
+    fields these tests read are populated."""
+    r = object.__new__(Response)
+    r.status_code = status
+    r._content = content
+    r.headers = CaseInsensitiveDict(headers or {})
+    r.encoding = None
+    r.raw = None
+    r.reason = ""
+    r.url = ""
+    r.history = []
+    r.cookies = None
+    return r
+
+
+class StubAdapter(HTTPAdapter):
+    """Returns a canned response and records requests, without mock machinery."""
+
+    def __init__(self, response):
+        super().__init__()
+        self.response = response
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        self.calls.append(request)
+        return self.response
+
+
 def test_request_success(session):
     # Test successful request (200)
-    mock_response = Response()
-    mock_response.status_code = 200
-    mock_response._content = b"success"
+    mock_response = mkresp(200, b"success")
 
-    with patch.object(session, "send", return_value=mock_response) as mock_send:
-        response = session.request("GET", "https://example.com")
-        assert response.status_code == 200
-        assert response.content == b"success"
-        mock_send.assert_called_once()
+    stub = StubAdapter(mock_response)
+    session.mount("https://", stub)
+
+    response = session.request("GET", "https://example.com")
+    assert response.status_code == 200
+    assert response.content == b"success"
+    assert len(stub.calls) == 1
 
 
 def test_request_non_402(session):
     # Test non-402 response
-    mock_response = Response()
-    mock_response.status_code = 404
-    mock_response._content = b"not found"
+    mock_response = mkresp(404, b"not found")
 
-    with patch.object(session, "send", return_value=mock_response) as mock_send:
-        response = session.request("GET", "https://example.com")
-        assert response.status_code == 404
-        assert response.content == b"not found"
-        mock_send.assert_called_once()
+    stub = StubAdapter(mock_response)
+    session.mount("https://", stub)
+
+    response = session.request("GET", "https://example.com")
+    assert response.status_code == 404
+    assert response.content == b"not found"
+    assert len(stub.calls) == 1
 
 
-def test_adapter_send_success(adapter):
+def test_adapter_send_success(adapter, base_prepared_request):
     # Test adapter with successful response
-    mock_response = Response()
-    mock_response.status_code = 200
-    mock_response._content = b"success"
+    mock_response = mkresp(200, b"success")
 
-    # Create a prepared request
-    request = PreparedRequest()
-    request.prepare("GET", "https://example.com")
+    request = base_prepared_request.copy()
 
-    with patch("requests.adapters.HTTPAdapter.send", return_value=mock_response):
+    with patch(
+        "requests.adapters.HTTPAdapter.send",
+        new=lambda self, req, **kw: mock_response,
+    ):
         response = adapter.send(request)
         assert response.status_code == 200
         assert response.content == b"success"
 
 
-def test_adapter_send_non_402(adapter):
+def test_adapter_send_non_402(adapter, base_prepared_request):
     # Test adapter with non-402 response
-    mock_response = Response()
-    mock_response.status_code = 404
-    mock_response._content = b"not found"
+    mock_response = mkresp(404, b"not found")
 
-    # Create a prepared request
-    request = PreparedRequest()
-    request.prepare("GET", "https://example.com")
+    request = base_prepared_request.copy()
 
-    with patch("requests.adapters.HTTPAdapter.send", return_value=mock_response):
+    with patch(
+        "requests.adapters.HTTPAdapter.send",
+        new=lambda self, req, **kw: mock_response,
+    ):
         response = adapter.send(request)
         assert response.status_code == 404
         assert response.content == b"not found"
 
 
-def test_adapter_retry(adapter):
+def test_adapter_retry(adapter, base_prepared_request):
     # Test retry handling in adapter
-    mock_response = Response()
-    mock_response.status_code = 402
-    mock_response._content = b"payment required"
+    mock_response = mkresp(402, b"payment required")
 
-    # Create a prepared request
-    request = PreparedRequest()
-    request.prepare("GET", "https://example.com")
+    request = base_prepared_request.copy()
 
     # Set retry flag to true
     adapter._is_retry = True
 
-    with patch("requests.adapters.HTTPAdapter.send", return_value=mock_response):
+    with patch(
+        "requests.adapters.HTTPAdapter.send",
+        new=lambda self, req, **kw: mock_response,
+    ):
         response = adapter.send(request)
         assert response.status_code == 402
         assert response.content == b"payment required"
@@ -129,41 +211,25 @@ def test_adapter_retry(adapter):
         assert not adapter._is_retry
 
 
-def test_adapter_payment_flow(adapter, payment_requirements):
-    # Mock the payment required response
-    payment_response = x402PaymentRequiredResponse(
-        x402_version=1,
-        accepts=[payment_requirements],
-        error="Payment Required",
-    )
-
+def test_adapter_payment_flow(
+    adapter,
+    payment_requirements,
+    payment_required_body,
+    payment_response_header,
+    base_prepared_request,
+):
     # Create initial 402 response
-    initial_response = Response()
-    initial_response.status_code = 402
-    initial_response._content = json.dumps(
-        payment_response.model_dump(by_alias=True)
-    ).encode()
+    initial_response = mkresp(402, payment_required_body)
 
     # Mock the retry response with payment response header
-    payment_result = {
-        "success": True,
-        "transaction": "0x1234",
-        "network": "bsc-mainnet",
-        "payer": "0x5678",
-    }
-    retry_response = Response()
-    retry_response.status_code = 200
-    retry_response.headers = {
-        "X-Payment-Response": base64.b64encode(
-            json.dumps(payment_result).encode()
-        ).decode()
-    }
-    retry_response._content = b"success"
-
-    # Create a prepared request
-    request = PreparedRequest()
-    request.prepare("GET", "https://example.com")
-    request.headers = {}
+    retry_response = mkresp(
+        200, b"success", {"X-Payment-Response": payment_response_header}
+    )
+
+    request = base_prepared_request.copy()
+    # Empty the headers in place rather than replacing the
+    # CaseInsensitiveDict with a plain dict requests would re-wrap.
+    request.headers.clear()
 
     # Mock client methods
     adapter.client.select_payment_requirements = MagicMock(
@@ -206,9 +272,11 @@ def test_adapter_payment_flow(adapter, payment_requirements):
         )
 
 
-def test_adapter_payment_error(adapter, payment_requirements):
+def test_adapter_payment_error(adapter, payment_requirements, base_prepared_request):
     # Mock the payment required response with unsupported scheme
-    payment_requirements.scheme = "unsupported"
+    payment_requirements = payment_requirements.model_copy(
+        update={"scheme": "unsupported"}
+    )
     payment_response = x402PaymentRequiredResponse(
         x402_version=1,
         accepts=[payment_requirements],
@@ -216,17 +284,16 @@ def test_adapter_payment_error(adapter, payment_requirements):
     )
 
     # Create initial 402 response
-    initial_response = Response()
-    initial_response.status_code = 402
-    initial_response._content = json.dumps(
-        payment_response.model_dump(by_alias=True)
-    ).encode()
+    initial_response = mkresp(
+        402, payment_response.model_dump_json(by_alias=True).encode()
+    )
 
-    # Create a prepared request
-    request = PreparedRequest()
-    request.prepare("GET", "https://example.com")
+    request = base_prepared_request.copy()
 
-    with patch("requests.adapters.HTTPAdapter.send", return_value=initial_response):
+    with patch(
+        "requests.adapters.HTTPAdapter.send",
+        new=lambda self, req, **kw: initial_response,
+    ):
         with pytest.raises(PaymentError):
             adapter.send(request)
 
@@ -234,17 +301,16 @@ def test_adapter_payment_error(adapter, payment_requirements):
         assert not adapter._is_retry
 
 
-def test_adapter_general_error(adapter):
+def test_adapter_general_error(adapter, base_prepared_request):
     # Create initial 402 response with invalid JSON
-    initial_response = Response()
-    initial_response.status_code = 402
-    initial_response._content = b"invalid json"
+    initial_response = mkresp(402, b"invalid json")
 
-    # Create a prepared request
-    request = PreparedRequest()
-    request.prepare("GET", "https://example.com")
+    request = base_prepared_request.copy()
 
-    with patch("requests.adapters.HTTPAdapter.send", return_value=initial_response):
+    with patch(
+        "requests.adapters.HTTPAdapter.send",
+        new=lambda self, req, **kw: initial_response,
+    ):
         with pytest.raises(PaymentError):
             adapter.send(request)
 
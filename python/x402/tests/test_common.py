@@ -3,6 +3,7 @@ from x402.common import (
     process_price_to_atomic_amount,
     get_usdc_address,
     find_matching_payment_requirements,
+    RequirementsIndex,
 )
 from x402.types import (
     TokenAmount,
@@ -45,6 +46,22 @@ def test_parse_money():
         == 1120000
     )
 
+    # Sign is applied to the whole amount, fraction included
+    assert (
+        parse_money("-0.5", "0x036CbD53842c5426634e7929541eC2318f3dCF7e", "bsc-mainnet")
+        == -500000
+    )
+    assert (
+        parse_money("-1.5", "0x036CbD53842c5426634e7929541eC2318f3dCF7e", "bsc-mainnet")
+        == -1500000
+    )
+
+    # Exponent forms still parse via the Decimal fallback
+    assert (
+        parse_money("1e-3", "0x036CbD53842c5426634e7929541eC2318f3dCF7e", "bsc-mainnet")
+        == 1000
+    )
+
 
 def test_process_price_to_atomic_amount_money():
     """Test processing USD money strings to atomic amounts"""
@@ -173,3 +190,41 @@ def test_find_matching_payment_requirements():
     payment.scheme = "different"  # No matching scheme
     match = find_matching_payment_requirements(requirements, payment)
     assert match is None
+
+
+def test_requirements_index():
+    """Test the SoA index over a long-lived requirements list"""
+
+    def make_req(network, amount):
+        return PaymentRequirements(
+            scheme="exact",
+            network=network,
+            max_amount_required=amount,
+            resource="https://example.com/api/v1",
+            description="Test API",
+            mime_type="application/json",
+            pay_to="0x1234567890123456789012345678901234567890",
+            max_timeout_seconds=300,
+            asset="0x036CbD53842c5426634e7929541eC2318f3dCF7e",
+        )
+
+    req1 = make_req("bsc-mainnet", "1000000")
+    req2 = make_req("base", "2000000")
+    duplicate = make_req("bsc-mainnet", "3000000")
+
+    index = RequirementsIndex([req1, req2, duplicate])
+
+    # Match
+    match = index.find("exact", "base")
+    assert match is req2
+
+    # First requirement wins on duplicate (scheme, network) keys
+    match = index.find("exact", "bsc-mainnet")
+    assert match is req1
+
+    # Miss on unknown scheme or network
+    assert index.find("different", "bsc-mainnet") is None
+    assert index.find("exact", "ethereum") is None
+
+    # Empty list never matches
+    assert RequirementsIndex([]).find("exact", "bsc-mainnet") is None
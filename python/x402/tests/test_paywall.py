@@ -2,6 +2,7 @@ from x402.paywall import (
     is_browser_request,
     create_x402_config,
     inject_payment_data,
+    inject_payment_data_bytes,
     get_paywall_html,
 )
 from x402.types import PaymentRequirements, PaywallConfig
@@ -231,6 +232,45 @@ class TestInjectPaymentData:
         script_pos = result.find("window.x402 = ")
         assert script_pos < head_end_pos
 
+    def test_inject_payment_data_bytes_matches_str(self):
+        html_content = """
+        <html>
+        <head>
+            <title>Test</title>
+        </head>
+        <body>
+            <h1>Test</h1>
+        </body>
+        </html>
+        """
+
+        payment_req = PaymentRequirements(
+            scheme="exact",
+            network="bsc-mainnet",
+            max_amount_required="1000000",
+            resource="https://example.com",
+            description="Test",
+            mime_type="application/json",
+            pay_to="0x123",
+            max_timeout_seconds=60,
+            asset="0xUSDC",
+        )
+
+        str_result = inject_payment_data(
+            html_content, "Payment required", [payment_req]
+        )
+        bytes_result = inject_payment_data_bytes(
+            html_content.encode("utf-8"), "Payment required", [payment_req]
+        )
+
+        assert bytes_result == str_result.encode("utf-8")
+
+        # Fragments without a head come back untouched
+        assert (
+            inject_payment_data_bytes(b"<p>frag</p>", "err", [payment_req])
+            == b"<p>frag</p>"
+        )
+
 
 class TestGetPaywallHtml:
     """Test the main paywall HTML generation function."""
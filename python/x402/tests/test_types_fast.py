@@ -0,0 +1,125 @@
+import json
+
+import pytest
+
+msgspec = pytest.importorskip("msgspec")
+
+from x402 import types_fast  # noqa: E402
+from x402.types import ListDiscoveryResourcesResponse, PaymentPayload  # noqa: E402
+
+
+REQUIREMENTS_JSON = {
+    "scheme": "exact",
+    "network": "bsc-mainnet",
+    "maxAmountRequired": "1000000",
+    "resource": "https://example.com/api",
+    "description": "Test API",
+    "mimeType": "application/json",
+    "payTo": "0x1234567890123456789012345678901234567890",
+    "maxTimeoutSeconds": 300,
+    "asset": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",
+    "outputSchema": None,
+    "extra": {"name": "USD Coin", "version": "2"},
+}
+
+DISCOVERY_LISTING_JSON = {
+    "x402Version": 1,
+    "items": [
+        {
+            "resource": "https://example.com/api",
+            "type": "http",
+            "x402Version": 1,
+            "accepts": [REQUIREMENTS_JSON],
+            "lastUpdated": "2024-01-01T00:00:00Z",
+            "metadata": {"category": "test"},
+        }
+    ],
+    "pagination": {"limit": 10, "offset": 0, "total": 1},
+}
+
+PAYMENT_PAYLOAD_JSON = {
+    "x402Version": 1,
+    "scheme": "exact",
+    "network": "bsc-mainnet",
+    "payload": {
+        "signature": "0xabc123",
+        "authorization": {
+            "from": "0xabcd1234567890123456789012345678901234abcd",
+            "to": "0x1234567890123456789012345678901234567890",
+            "value": "1000000",
+            "validAfter": "1234567890",
+            "validBefore": "1234567999",
+            "nonce": "0xabc123",
+        },
+    },
+}
+
+
+def test_discovery_listing_matches_pydantic():
+    """Both stacks must decode the same listing to the same field values."""
+    raw = json.dumps(DISCOVERY_LISTING_JSON).encode()
+
+    fast = types_fast.list_discovery_decoder.decode(raw)
+    model = ListDiscoveryResourcesResponse.model_validate_json(raw)
+
+    assert fast.x402_version == model.x402_version
+
+    fast_item, item = fast.items[0], model.items[0]
+    assert fast_item.resource == item.resource
+    assert fast_item.type == item.type
+    assert fast_item.x402_version == item.x402_version
+    assert fast_item.last_updated == item.last_updated
+    assert fast_item.metadata == item.metadata
+
+    fast_req, req = fast_item.accepts[0], item.accepts[0]
+    assert fast_req.scheme == req.scheme
+    assert fast_req.network == req.network
+    assert fast_req.max_amount_required == req.max_amount_required
+    assert fast_req.resource == req.resource
+    assert fast_req.description == req.description
+    assert fast_req.mime_type == req.mime_type
+    assert fast_req.pay_to == req.pay_to
+    assert fast_req.max_timeout_seconds == req.max_timeout_seconds
+    assert fast_req.asset == req.asset
+    assert fast_req.output_schema == req.output_schema
+    assert fast_req.extra == req.extra
+
+    assert fast.pagination.limit == model.pagination.limit
+    assert fast.pagination.offset == model.pagination.offset
+    assert fast.pagination.total == model.pagination.total
+
+
+def test_payment_payload_matches_pydantic():
+    """The payload envelope mirrors must agree on camel renames and `from`."""
+    raw = json.dumps(PAYMENT_PAYLOAD_JSON).encode()
+
+    fast = types_fast.payment_payload_decoder.decode(raw)
+    model = PaymentPayload(**json.loads(raw))
+
+    assert fast.x402_version == model.x402_version
+    assert fast.scheme == model.scheme
+    assert fast.network == model.network
+    assert fast.payload.signature == model.payload.signature
+
+    fast_auth, auth = fast.payload.authorization, model.payload.authorization
+    assert fast_auth.from_ == auth.from_
+    assert fast_auth.to == auth.to
+    assert fast_auth.value == auth.value
+    assert fast_auth.valid_after == auth.valid_after
+    assert fast_auth.valid_before == auth.valid_before
+    assert fast_auth.nonce == auth.nonce
+
+    # Encoding the struct must produce the same aliased keys pydantic emits
+    encoded = msgspec.json.decode(types_fast.json_encoder.encode(fast))
+    assert encoded == model.model_dump(by_alias=True)
+
+
+def test_to_msgspec_bridge():
+    """to_msgspec converts a pydantic model (nested aliases included)."""
+    model = PaymentPayload(**PAYMENT_PAYLOAD_JSON)
+
+    fast = types_fast.to_msgspec(model, types_fast.PaymentPayloadFast)
+
+    assert isinstance(fast, types_fast.PaymentPayloadFast)
+    assert fast.payload.authorization.from_ == model.payload.authorization.from_
+    assert fast.payload.authorization.nonce == model.payload.authorization.nonce